@@ -2,6 +2,59 @@ import streamlit as st
 import numpy as np
 import plotly.graph_objects as go
 
+from lcoe_kernel import lcoe_kernel
+
+# Kaleido is optional; it is only needed for the static-image Fast mode
+try:
+    import kaleido
+except ImportError:
+    kaleido = None
+
+# Plot axes (log scale)
+# X-axis: Launch Cost ($/kg) - 100 to 5,000
+LAUNCH_COST_MIN = 100
+LAUNCH_COST_MAX = 5000
+# Y-axis: Array Cost ($/W) - 1 to 1000
+ARRAY_COST_MIN = 1
+ARRAY_COST_MAX = 1000
+# A coarse grid covers the full range; once a point is selected a finer grid
+# spanning ZOOM_HALF_WIDTH decades either side of it is drawn on top
+COARSE_GRID_POINTS = 20
+ZOOM_GRID_POINTS = 30
+ZOOM_HALF_WIDTH = 0.5
+
+# Plot trace settings (Plotly copies these, so they can be shared)
+HEATMAP_HOVERTEMPLATE = 'Launch Cost: $%{x:.2f}/kg<br>Array Cost: $%{y:.2f}/W<br>LCOE: $%{z:.4f}/W<extra></extra>'
+HEATMAP_COLORBAR = dict(title="LCOE ($/kWh)")
+CLICK_HOVERTEMPLATE = 'Launch Cost: $%{x:.2f}/kg<br>Array Cost: $%{y:.2f}/W<br>Click to select<extra></extra>'
+
+# Input combinations kept in the grid/figure caches; the sliders alone allow
+# thousands of combinations, so the caches are bounded
+CACHE_MAX_ENTRIES = 128
+
+# Coarse grid axes; they depend on no widget
+LAUNCH_COST_POINTS = np.logspace(np.log10(LAUNCH_COST_MIN), np.log10(LAUNCH_COST_MAX), COARSE_GRID_POINTS)
+ARRAY_COST_POINTS = np.logspace(np.log10(ARRAY_COST_MIN), np.log10(ARRAY_COST_MAX), COARSE_GRID_POINTS)
+
+# Text for the Key Variable Descriptions section
+DESCRIPTIONS_MD = """
+Project lifetime and discount rate: Lazard's [LCOE analysis](https://www.lazard.com/research-insights/levelized-cost-of-energyplus-lcoeplus/) for utility-scale solar PV uses a 35 year project lifetime and a 7.7% discount rate. A project lifetime of 10 years may be more appropriate, matching the typical lifetime of commerical LEO satellites. 
+
+Solar Irradiance: A typical southwest US location sees an annualized average irradiance of 5.5 kWh/m2/day, accounting for day/night cycles, weather, and the absorption of portions of the solar spectrum by the atmosphere [NREL](https://www.nrel.gov/gis/solar-resource-maps). In space, assume the [AM0](https://www.pveducation.org/pvcdrom/appendices/standard-solar-spectra) solar spectrum (1366 W/m2) and (optimistically) 24 hours of sunlight a day year-round. 
+
+PV panel type: Panel efficiency is assumed to be 21% for monocrystalline Si and 32% for multi-junction GaAs. Efficiency will be reduced at the elevated temperature expected. 
+
+Launch mass: The launch mass is, at minimum, the panel mass. Mechanical structure, wiring, and the mass of the electricity user, etc. will increase this. A terrestrial solar panel (e.g. design for mounting on a roof) might weigh [10](https://freedomsolarpower.com/blog/solar-panel-weight-guide) - [20](https://www.greenmatch.co.uk/solar-energy/solar-panels/sizes) kg/m^2 -- not including any additional structure. Current space-ready PV panels weigh ~2 kg/m^2 ([A](https://blueskies.nianet.org/wp-content/uploads/2023-Blue-Skies-Final-Research-Paper-University-of-Texas-Austin.pdf), [B](https://magazine.caltech.edu/post/sspp-space-solar-power-project)). Research targets for lightweight panels are as low as 0.05 kg/m^2 (requiring T.B.D. new technology) to 0.25 kg/m^2 (existing [thin-film](https://blueskies.nianet.org/wp-content/uploads/2023-Blue-Skies-Final-Research-Paper-University-of-Texas-Austin.pdf) with durability concerns?)
+
+Array cost: For existing space-base PV, cost estimates range from [\$31](https://magazine.caltech.edu/post/sspp-space-solar-power-project) per Watt for manufacturing GaAs cells to [\$700--1000](https://ntrs.nasa.gov/api/citations/20205002844/downloads/Solar%20Power%20Generation_2.pdf) per Watt for the entire array. Terrestrial installations have hardware costs of the order [\$1](https://www.energy.gov/eere/solar/solar-photovoltaic-system-cost-benchmarks) per W, while the panels or modules themselves are only [\$0.25](https://ourworldindata.org/grapher/solar-pv-prices) per Watt.
+
+Launch cost: Currently in the range \$1000--5000 per kg with projections down to \$100 for launch to LEO.
+
+My conclusions: The default values are my optimistic assumptions for a near-future space-based deployment of monocrystalline Si panels. If one assumes an array capital ocst that is similar to terrestrial use and a reduction in launch costs to $100/kg, then the LCOE is similar to that of terrestrial solar PV, of the order cents per kWh. 
+A major uncertainty, to me, is the durability of 'normal' PV cells in a space environment, subject to increased UV light, radiation, and elevated temperature. 
+
+"""
+
 # Page configuration
 st.set_page_config(
     page_title="Space Solar LCOE",
@@ -24,23 +77,16 @@ discount_rate = st.sidebar.slider(
     key="discount_rate"
 )
 
-# 2. Project lifetime textbox (positive integers only)
-project_duration_input = st.sidebar.text_input(
+# 2. Project lifetime (positive integers only, validated by the widget)
+project_duration = st.sidebar.number_input(
     "Project lifetime (years)",
-    value="10",
-    key="project_duration_input"
+    min_value=1,
+    max_value=100,
+    value=10,
+    step=1,
+    key="project_duration"
 )
 
-# Validate and convert project duration
-try:
-    project_duration = int(project_duration_input)
-    if project_duration <= 0:
-        st.sidebar.error("Project lifetime must be a positive integer")
-        project_duration = 10  # Default fallback
-except ValueError:
-    st.sidebar.error("Please enter a valid positive integer")
-    project_duration = 10  # Default fallback
-
 # 3. Solar irradiance dropdown
 solar_irr_option = st.sidebar.selectbox(
     "Solar Irradiance",
@@ -74,166 +120,295 @@ launch_mass = st.sidebar.slider(
     key="launch_mass"
 )
 
-# Display current values
-st.sidebar.markdown("---")
-st.sidebar.markdown("### Current Values")
-st.sidebar.write(f"Discount Rate: {discount_rate:.1f}%")
-st.sidebar.write(f"Project Lifetime: {project_duration} years")
-st.sidebar.write(f"Power Generation: {power_gen_rate} kWh/day")
-st.sidebar.write(f"Launch Mass: {launch_mass:.2f} kg/m²")
+# Fast mode shows the heatmap as a static image, which is quicker for the
+# browser to render than the interactive chart but can't be clicked.
+# Importing kaleido isn't enough for it to work (recent releases also need
+# Chrome), so a failed export is remembered and disables the toggle
+png_export_error = st.session_state.get('png_export_error')
+if kaleido is None:
+    fast_mode_help = "Requires the kaleido package"
+elif png_export_error:
+    fast_mode_help = f"Image export failed: {png_export_error}"
+else:
+    fast_mode_help = "Point selection is unavailable in Fast mode"
+
+fast_mode = st.sidebar.toggle(
+    "Fast mode (static image)",
+    value=False,
+    key="fast_mode",
+    disabled=kaleido is None or bool(png_export_error),
+    help=fast_mode_help
+) and kaleido is not None and not png_export_error
+
+# Display current values (one widget; markdown needs two trailing spaces for a line break)
+st.sidebar.caption(
+    "**Current Values**  \n"
+    f"Discount Rate: {discount_rate:.1f}%  \n"
+    f"Project Lifetime: {project_duration} years  \n"
+    f"Power Generation: {power_gen_rate:.2f} kWh/m²/day  \n"
+    f"Launch Mass: {launch_mass:.2f} kg/m²"
+)
 
-# LCOE calculation function
-def calculate_lcoe(launch_cost_grid, array_cost_grid, project_duration, discount_rate):
-    # lifetime_cost is the total cost per m^2: launch cost plus array cost grid (all $/m^2)
+def zoom_axis(center, axis_min, axis_max):
+    # Logspace window ZOOM_HALF_WIDTH decades either side of center, clipped to the axis range
+    log_center = np.log10(center)
+    log_lo = max(log_center - ZOOM_HALF_WIDTH, np.log10(axis_min))
+    log_hi = min(log_center + ZOOM_HALF_WIDTH, np.log10(axis_max))
+    return np.logspace(log_lo, log_hi, ZOOM_GRID_POINTS)
+
+# Present value of 1 unit per year for project_duration years, discounted from year 1.
+# The sum of q**year for year = 1..N is the geometric series q * (1 - q**N) / (1 - q);
+# at a zero discount rate q == 1 and the sum is just N
+def annuity_factor(discount_rate, project_duration):
+    q = 1.0 / (1.0 + np.asarray(discount_rate, dtype=float) / 100.0)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        series = q * (1.0 - q ** project_duration) / (1.0 - q)
+    return np.where(q == 1.0, project_duration, series)
+
+# Calculate lifetime energy output per m^2 (kWh) using discounted sum over project duration
+# power_gen_rate is kWh/m^2/day; multiply by 365 for annual; discount for each year
+def discounted_lifetime_energy(discount_rate, project_duration, power_gen_rate):
+    return power_gen_rate * 365.0 * annuity_factor(discount_rate, project_duration)
+
+# LCOE is linear in launch cost ($/kg) and array cost ($/W); this returns the
+# $/kWh per unit of each, shared by calculate_lcoe and the numba kernel
+def lcoe_coefficients(discount_rate, project_duration, power_gen_rate, launch_mass, panel_eff):
+    lifetime_energy = discounted_lifetime_energy(discount_rate, project_duration, power_gen_rate)
+
+    # lifetime cost is the total cost per m^2: launch cost plus array cost (all $/m^2)
     # panel eff * 1000 W/m^2 standard incident is the standard output W/m2. times $/W gives array cost per m^2
-    lifetime_cost = (launch_cost_grid * launch_mass) + (array_cost_grid * panel_eff * 1000)  # $/m^2
-
-    # Calculate lifetime energy output per m^2 (kWh) using discounted sum over project duration
-    # power_gen_rate is kWh/m^2/day; multiply by 365 for annual; discount for each year
-    years = np.arange(1, project_duration + 1)
-    discount_factors = 1 / (1 + (discount_rate / 100)) ** years
-    lifetime_energy = np.sum(power_gen_rate * 365 * discount_factors)
+    return launch_mass / lifetime_energy, panel_eff * 1000 / lifetime_energy
 
-    lcoe = lifetime_cost / lifetime_energy
+# LCOE calculation function
+# All arguments broadcast against each other, so a parameter sweep is a single
+# vectorized call: e.g. project_duration=np.arange(5, 40)[:, None, None] with
+# launch/array cost axes shaped (1, x) and (y, 1) gives a (sweep, y, x) result.
+# The scalar parameters follow the same order as build_lcoe_grid and the sidebar
+def calculate_lcoe(launch_cost, array_cost, discount_rate, project_duration,
+                   power_gen_rate, launch_mass, panel_eff):
+    launch_cost_coeff, array_cost_coeff = lcoe_coefficients(
+        discount_rate, project_duration, power_gen_rate, launch_mass, panel_eff
+    )
+
+    # The division by lifetime energy is folded into each term's coefficient so it is
+    # applied to the (small) cost axes; for the heatmap grid the final sum is the only full-size array
+    lcoe = (launch_cost * launch_cost_coeff) + (array_cost * array_cost_coeff)
     return lcoe
 
-# Generate data for surface plot
-# X-axis: Launch Cost ($/kg) - log scale from 100 to 10,000
-launch_cost_min = 100
-launch_cost_max = 5000
-launch_cost_points = np.logspace(np.log10(launch_cost_min), np.log10(launch_cost_max), 50)
-
-# Y-axis: Array Cost ($/W) - log scale from 1 to 1000
-array_cost_min = 1
-array_cost_max = 1000
-array_cost_points = np.logspace(np.log10(array_cost_min), np.log10(array_cost_max), 50)
-
-# Create meshgrid
-launch_cost_grid, array_cost_grid = np.meshgrid(launch_cost_points, array_cost_points)
-
-# Calculate LCOE for all combinations
-lcoe_grid = calculate_lcoe(
-    launch_cost_grid,
-    array_cost_grid,
-    project_duration,
-    discount_rate
-)
-
-# Create 2D heatmap plot
-fig = go.Figure()
-
-# Add heatmap
-fig.add_trace(go.Heatmap(
-    z=lcoe_grid,
-    x=launch_cost_grid[0, :],  # X-axis values (Launch Cost)
-    y=array_cost_grid[:, 0],  # Y-axis values (Array Cost)
-    colorscale='Viridis',
-    hovertemplate='Launch Cost: $%{x:.2f}/kg<br>Array Cost: $%{y:.2f}/W<br>LCOE: $%{z:.4f}/W<extra></extra>',
-    colorbar=dict(title="LCOE ($/kWh)"),
-    showscale=True
-))
-
-# Add invisible scatter points for click detection
-# Flatten the grids for scatter plot
-launch_cost_flat = launch_cost_grid.flatten()
-array_cost_flat = array_cost_grid.flatten()
-lcoe_flat = lcoe_grid.flatten()
-
-fig.add_trace(go.Scatter(
-    x=launch_cost_flat,
-    y=array_cost_flat,
-    mode='markers',
-    marker=dict(size=10, opacity=0, symbol='circle'),  # Invisible but clickable markers
-    hovertemplate='Launch Cost: $%{x:.2f}/kg<br>Array Cost: $%{y:.2f}/W<br>LCOE: $%{customdata:.4f}/W<extra></extra>',
-    customdata=lcoe_flat,
-    name='click_points',
-    legendgroup='click_points',
-    showlegend=False
-))
-
-fig.update_layout(
-    title='Levelized cost of electricity:',
-    xaxis=dict(
-        title='Launch Cost ($/kg)',
-        type='log'
-    ),
-    yaxis=dict(
-        title='Array Cost ($/W)',
-        type='log'
-    ),
-    width=900,
-    height=700,
-    margin=dict(l=0, r=0, t=50, b=0)
-)
+# LCOE grid over the given axes, shape (len(array_cost_points), len(launch_cost_points))
+def compute_lcoe_grid(launch_cost_points, array_cost_points, discount_rate, project_duration,
+                      power_gen_rate, launch_mass, panel_eff):
+    # The compiled kernel (when numba is installed) evaluates the same grid
+    if lcoe_kernel is not None:
+        launch_cost_coeff, array_cost_coeff = lcoe_coefficients(
+            discount_rate, project_duration, power_gen_rate, launch_mass, panel_eff
+        )
+        return lcoe_kernel(launch_cost_points, array_cost_points,
+                           float(launch_cost_coeff), float(array_cost_coeff))
+
+    # Calculate LCOE for all combinations. The cost is separable, so the axes are
+    # passed as a row and a column and only the final outer sum is 2-D, giving
+    # the (len(y), len(x)) grid the heatmap expects
+    lcoe_grid = calculate_lcoe(
+        launch_cost_points[None, :],
+        array_cost_points[:, None],
+        discount_rate,
+        project_duration,
+        power_gen_rate,
+        launch_mass,
+        panel_eff
+    )
+    return lcoe_grid
+
+# Grid generation is cached on the scalar inputs so reruns that don't change
+# them (plot clicks, unrelated widgets) skip the recomputation
+@st.cache_data(max_entries=CACHE_MAX_ENTRIES)
+def build_lcoe_grid(discount_rate, project_duration, power_gen_rate, launch_mass, panel_eff):
+    return compute_lcoe_grid(LAUNCH_COST_POINTS, ARRAY_COST_POINTS, discount_rate, project_duration,
+                             power_gen_rate, launch_mass, panel_eff)
+
+# The zoom grid is also keyed on its center, the currently selected point
+@st.cache_data(max_entries=CACHE_MAX_ENTRIES)
+def build_zoom_grid(discount_rate, project_duration, power_gen_rate, launch_mass, panel_eff,
+                    center_launch_cost, center_array_cost):
+    launch_cost_points = zoom_axis(center_launch_cost, LAUNCH_COST_MIN, LAUNCH_COST_MAX)
+    array_cost_points = zoom_axis(center_array_cost, ARRAY_COST_MIN, ARRAY_COST_MAX)
+    lcoe_grid = compute_lcoe_grid(launch_cost_points, array_cost_points, discount_rate, project_duration,
+                                  power_gen_rate, launch_mass, panel_eff)
+    return launch_cost_points, array_cost_points, lcoe_grid
+
+def heatmap_trace(launch_cost_points, array_cost_points, lcoe_grid):
+    # Heatmap z is row-major with shape (len(y), len(x)): rows follow array
+    # cost, columns follow launch cost. calculate_lcoe builds the grid in
+    # that order, so keep it C-contiguous here rather than transposing.
+    # Rounding to the 4 places the hover shows keeps the JSON payload small.
+    # This stays float64: plotly 5 writes arrays as JSON lists, and float32
+    # values widen to long float64 reprs there (e.g. 0.02410000003874302)
+    z = np.ascontiguousarray(np.round(lcoe_grid, 4))
+
+    return go.Heatmap(
+        z=z,
+        x=launch_cost_points,  # X-axis values (Launch Cost)
+        y=array_cost_points,  # Y-axis values (Array Cost)
+        coloraxis='coloraxis',  # shared, so the coarse and zoom grids use one color scale
+        hovertemplate=HEATMAP_HOVERTEMPLATE
+    )
+
+def click_trace(launch_cost_points, array_cost_points):
+    # Invisible scatter points for click detection. plotly.js heatmaps
+    # don't support selection, so st.plotly_chart reports no clicks on them;
+    # these markers receive the clicks instead. They carry no LCOE values;
+    # the selected point's LCOE is computed server side, so their hover
+    # label (which takes over from the heatmap's) shows only the costs
+    return go.Scatter(
+        x=np.tile(launch_cost_points, len(array_cost_points)),
+        y=np.repeat(array_cost_points, len(launch_cost_points)),
+        mode='markers',
+        marker=dict(size=10, opacity=0, symbol='circle'),  # Invisible but clickable markers
+        hovertemplate=CLICK_HOVERTEMPLATE,
+        name='click_points',
+        legendgroup='click_points',
+        showlegend=False
+    )
+
+# Figure construction is cached on the same inputs as the grids, so the
+# Plotly object (and its JSON serialization) is reused across reruns. The
+# figure is shared between sessions and must not be modified after it is built
+@st.cache_resource(max_entries=CACHE_MAX_ENTRIES)
+def build_figure(discount_rate, project_duration, power_gen_rate, launch_mass, panel_eff,
+                 zoom_center=None):
+    lcoe_grid = build_lcoe_grid(
+        discount_rate, project_duration, power_gen_rate, launch_mass, panel_eff
+    )
+
+    # Create 2D heatmap plot
+    fig = go.Figure()
+
+    # Add coarse heatmap over the full range
+    fig.add_trace(heatmap_trace(LAUNCH_COST_POINTS, ARRAY_COST_POINTS, lcoe_grid))
+    fig.add_trace(click_trace(LAUNCH_COST_POINTS, ARRAY_COST_POINTS))
+
+    # Add the finer heatmap around the selected point on top
+    if zoom_center is not None:
+        zoom_launch_points, zoom_array_points, zoom_grid = build_zoom_grid(
+            discount_rate, project_duration, power_gen_rate, launch_mass, panel_eff, *zoom_center
+        )
+        fig.add_trace(heatmap_trace(zoom_launch_points, zoom_array_points, zoom_grid))
+        fig.add_trace(click_trace(zoom_launch_points, zoom_array_points))
+
+    fig.update_layout(
+        title='Levelized cost of electricity:',
+        xaxis=dict(
+            title='Launch Cost ($/kg)',
+            type='log'
+        ),
+        yaxis=dict(
+            title='Array Cost ($/W)',
+            type='log'
+        ),
+        coloraxis=dict(
+            colorscale='Viridis',
+            colorbar=HEATMAP_COLORBAR
+        ),
+        width=900,
+        height=700,
+        margin=dict(l=0, r=0, t=50, b=0)
+    )
+    return fig
+
+# PNG rendering for Fast mode, cached on the same inputs as the figure. There
+# is no selection in Fast mode, so the image has no zoom layer
+@st.cache_data(max_entries=CACHE_MAX_ENTRIES)
+def render_png(discount_rate, project_duration, power_gen_rate, launch_mass, panel_eff):
+    fig = build_figure(discount_rate, project_duration, power_gen_rate, launch_mass, panel_eff,
+                       zoom_center=None)
+    return fig.to_image(format="png", width=900, height=700)
+
+lcoe_inputs = (discount_rate, project_duration, power_gen_rate, launch_mass, panel_eff)
 
 # Initialize session state for selected point
 if 'selected_point' not in st.session_state:
     st.session_state.selected_point = None
 
-# Display the plot with click selection
-event = st.plotly_chart(
-    fig, 
-    use_container_width=True,
-    on_select="rerun",
-    key="lcoe_plot"
-)
-
-# Process selection from event
-if event and 'selection' in event:
-    selection = event['selection']
-    if selection and 'points' in selection:
-        points = selection['points']
-        if points:
-            # Get the first selected point
-            point = points[0]
-            selected_launch_cost = point.get('x', 0)
-            selected_array_cost = point.get('y', 0)
-            
-            # Try to get LCOE from customdata (if from scatter point)
-            selected_lcoe = point.get('customdata', None)
-            
-            # If not from scatter point, calculate from grid
-            if selected_lcoe is None:
-                launch_idx = np.argmin(np.abs(launch_cost_points - selected_launch_cost))
-                cost_idx = np.argmin(np.abs(array_cost_points - selected_array_cost))
-                selected_lcoe = lcoe_grid[cost_idx, launch_idx]
-            
-            st.session_state.selected_point = {
-                'launch_cost': selected_launch_cost,
-                'array_cost': selected_array_cost,
-                'lcoe': selected_lcoe
-            }
-
-# Display selected point values below the plot
-if st.session_state.selected_point:
-    st.markdown("---")
-    st.markdown("### Selected Point")
-    col1, col2, col3 = st.columns(3)
-    with col1:
-        st.metric("Launch Cost", f"${st.session_state.selected_point['launch_cost']:.2f}/kg")
-    with col2:
-        st.metric("Array Cost", f"${st.session_state.selected_point['array_cost']:.2f}/W")
-    with col3:
-        st.metric("LCOE", f"${st.session_state.selected_point['lcoe']:.4f}/W")
-
-# Key variable descriptions
+# The plot and selected-point metrics run as a fragment, so clicking a point
+# reruns only this panel instead of the sidebar code above. The figure is
+# built here because the zoom grid follows the selection
+@st.fragment
+def selection_panel(lcoe_inputs):
+    discount_rate, project_duration, power_gen_rate, launch_mass, panel_eff = lcoe_inputs
+
+    selected_point = st.session_state.selected_point
+    zoom_center = None if selected_point is None else (selected_point['launch_cost'], selected_point['array_cost'])
+
+    # Display the plot with click selection
+    event = st.plotly_chart(
+        build_figure(*lcoe_inputs, zoom_center=zoom_center), 
+        use_container_width=True,
+        on_select="rerun",
+        key="lcoe_plot"
+    )
+
+    # Process selection from event
+    if event and 'selection' in event:
+        selection = event['selection']
+        if selection and 'points' in selection:
+            points = selection['points']
+            if points and 'x' in points[0] and 'y' in points[0]:
+                # Get the first selected point
+                point = points[0]
+                selected_point = {
+                    'launch_cost': point['x'],
+                    'array_cost': point['y']
+                }
+
+                # The zoom grid is centered on the selected point, so a new
+                # selection reruns the fragment to rebuild the figure around it
+                if selected_point != st.session_state.selected_point:
+                    st.session_state.selected_point = selected_point
+                    st.rerun(scope="fragment")
+
+    # Display selected point values below the plot
+    if st.session_state.selected_point:
+        selected_launch_cost = st.session_state.selected_point['launch_cost']
+        selected_array_cost = st.session_state.selected_point['array_cost']
+
+        # Evaluate LCOE at the point itself; it may be on either grid, and
+        # this stays current when the sidebar inputs change
+        selected_lcoe = calculate_lcoe(
+            selected_launch_cost,
+            selected_array_cost,
+            discount_rate,
+            project_duration,
+            power_gen_rate,
+            launch_mass,
+            panel_eff
+        )
+
+        st.markdown("---")
+        st.markdown("### Selected Point")
+        col1, col2, col3 = st.columns(3)
+        with col1:
+            st.metric("Launch Cost", f"${selected_launch_cost:.2f}/kg")
+        with col2:
+            st.metric("Array Cost", f"${selected_array_cost:.2f}/W")
+        with col3:
+            st.metric("LCOE", f"${selected_lcoe:.4f}/W")
+
+png = None
+if fast_mode:
+    try:
+        png = render_png(*lcoe_inputs)
+    except Exception as e:
+        # Fall back to the interactive chart
+        st.session_state.png_export_error = str(e).strip() or type(e).__name__
+        st.sidebar.error(f"Fast mode is unavailable, showing the interactive chart: {st.session_state.png_export_error}")
+
+if png is not None:
+    st.image(png)
+else:
+    selection_panel(lcoe_inputs)
+
+# Key variable descriptions, collapsed by default
 st.markdown("---")
-st.markdown("### Key Variable Descriptions")
-st.markdown("""
-Project lifetime and discount rate: Lazard's [LCOE analysis](https://www.lazard.com/research-insights/levelized-cost-of-energyplus-lcoeplus/) for utility-scale solar PV uses a 35 year project lifetime and a 7.7% discount rate. A project lifetime of 10 years may be more appropriate, matching the typical lifetime of commerical LEO satellites. 
-
-Solar Irradiance: A typical southwest US location sees an annualized average irradiance of 5.5 kWh/m2/day, accounting for day/night cycles, weather, and the absorption of portions of the solar spectrum by the atmosphere [NREL](https://www.nrel.gov/gis/solar-resource-maps). In space, assume the [AM0](https://www.pveducation.org/pvcdrom/appendices/standard-solar-spectra) solar spectrum (1366 W/m2) and (optimistically) 24 hours of sunlight a day year-round. 
-
-PV panel type: Panel efficiency is assumed to be 21% for monocrystalline Si and 32% for multi-junction GaAs. Efficiency will be reduced at the elevated temperature expected. 
-
-Launch mass: The launch mass is, at minimum, the panel mass. Mechanical structure, wiring, and the mass of the electricity user, etc. will increase this. A terrestrial solar panel (e.g. design for mounting on a roof) might weigh [10](https://freedomsolarpower.com/blog/solar-panel-weight-guide) - [20](https://www.greenmatch.co.uk/solar-energy/solar-panels/sizes) kg/m^2 -- not including any additional structure. Current space-ready PV panels weigh ~2 kg/m^2 ([A](https://blueskies.nianet.org/wp-content/uploads/2023-Blue-Skies-Final-Research-Paper-University-of-Texas-Austin.pdf), [B](https://magazine.caltech.edu/post/sspp-space-solar-power-project)). Research targets for lightweight panels are as low as 0.05 kg/m^2 (requiring T.B.D. new technology) to 0.25 kg/m^2 (existing [thin-film](https://blueskies.nianet.org/wp-content/uploads/2023-Blue-Skies-Final-Research-Paper-University-of-Texas-Austin.pdf) with durability concerns?)
-
-Array cost: For existing space-base PV, cost estimates range from [\$31](https://magazine.caltech.edu/post/sspp-space-solar-power-project) per Watt for manufacturing GaAs cells to [\$700--1000](https://ntrs.nasa.gov/api/citations/20205002844/downloads/Solar%20Power%20Generation_2.pdf) per Watt for the entire array. Terrestrial installations have hardware costs of the order [\$1](https://www.energy.gov/eere/solar/solar-photovoltaic-system-cost-benchmarks) per W, while the panels or modules themselves are only [\$0.25](https://ourworldindata.org/grapher/solar-pv-prices) per Watt.
-
-Launch cost: Currently in the range \$1000--5000 per kg with projections down to \$100 for launch to LEO.
-
-My conclusions: The default values are my optimistic assumptions for a near-future space-based deployment of monocrystalline Si panels. If one assumes an array capital ocst that is similar to terrestrial use and a reduction in launch costs to $100/kg, then the LCOE is similar to that of terrestrial solar PV, of the order cents per kWh. 
-A major uncertainty, to me, is the durability of 'normal' PV cells in a space environment, subject to increased UV light, radiation, and elevated temperature. 
-
-""")
-
+with st.expander("Key Variable Descriptions", expanded=False):
+    st.markdown(DESCRIPTIONS_MD)
@@ -0,0 +1,26 @@
+# Compiled LCOE grid kernel for app.py, used when numba is installed; without
+# it app.py computes the grid with plain NumPy. This lives in its own module
+# because Streamlit re-executes app.py on every rerun, while imported modules
+# stay loaded, so the kernel is compiled (or loaded from the cache=True disk
+# cache) once per process rather than once per rerun
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+if njit is not None:
+    @njit(cache=True, fastmath=True)
+    def lcoe_kernel(launch_cost_points, array_cost_points, launch_cost_coeff, array_cost_coeff):
+        # Coefficients come from app.lcoe_coefficients ($/kWh per $/kg and per $/W)
+        n_x = launch_cost_points.shape[0]
+        n_y = array_cost_points.shape[0]
+        out = np.empty((n_y, n_x))
+        for i in range(n_y):
+            array_term = array_cost_points[i] * array_cost_coeff
+            for j in range(n_x):
+                out[i, j] = launch_cost_points[j] * launch_cost_coeff + array_term
+        return out
+else:
+    lcoe_kernel = None